@@ -18,6 +18,7 @@
 #include <rpc/names.h>
 #include <rpc/server.h>
 #include <script/names.h>
+#include <sync.h>
 #include <txmempool.h>
 #include <util/strencodings.h>
 #include <validation.h>
@@ -32,8 +33,10 @@
 
 #include <algorithm>
 #include <cassert>
+#include <map>
 #include <memory>
 #include <stdexcept>
+#include <string>
 
 namespace
 {
@@ -593,6 +596,41 @@ name_history ()
 
 /* ************************************************************************** */
 
+/**
+ * Maximum number of compiled regexps kept around for name_scan.  When
+ * the cache is full, it is simply cleared; clients typically use only
+ * very few distinct patterns repeatedly.
+ */
+constexpr size_t MAX_CACHED_REGEXPS = 64;
+
+Mutex csRegexpCache;
+std::map<std::string, std::shared_ptr<const boost::xpressive::sregex>>
+    regexpCache GUARDED_BY (csRegexpCache);
+
+/**
+ * Returns the compiled regexp for the given pattern, reusing an earlier
+ * compilation from the cache if possible.  This makes repeated calls with
+ * the same pattern cheap.  Throws regex_error if the pattern is invalid.
+ */
+std::shared_ptr<const boost::xpressive::sregex>
+GetCompiledRegexp (const std::string& pattern)
+{
+  LOCK (csRegexpCache);
+
+  const auto mit = regexpCache.find (pattern);
+  if (mit != regexpCache.end ())
+    return mit->second;
+
+  auto res = std::make_shared<const boost::xpressive::sregex> (
+      boost::xpressive::sregex::compile (pattern));
+
+  if (regexpCache.size () >= MAX_CACHED_REGEXPS)
+    regexpCache.clear ();
+  regexpCache.emplace (pattern, res);
+
+  return res;
+}
+
 RPCHelpMan
 name_scan ()
 {
@@ -680,12 +718,14 @@ name_scan ()
   if (options.exists ("prefix"))
     prefix = DecodeNameFromRPCOrThrow (options["prefix"], options);
 
-  bool haveRegexp = false;
-  boost::xpressive::sregex regexp;
+  /* Patterns that match every string need not be compiled or searched.
+     For them, regexp is left as null.  */
+  std::shared_ptr<const boost::xpressive::sregex> regexp;
   if (options.exists ("regexp"))
     {
-      haveRegexp = true;
-      regexp = boost::xpressive::sregex::compile (options["regexp"].get_str ());
+      const std::string& pattern = options["regexp"].get_str ();
+      if (pattern != "" && pattern != ".*")
+        regexp = GetCompiledRegexp (pattern);
     }
 
   /* Iterate over names and produce the result.  */
@@ -704,8 +744,28 @@ name_scan ()
   valtype name;
   CNameData data;
   const auto& coinsTip = chainman.ActiveChainstate ().CoinsTip ();
+  /* The name database is keyed by the serialised names, i.e. with a
+     CompactSize length in front.  For names shorter than 253 bytes, the
+     length is a single byte, so those are ordered by length first and then
+     lexicographically, and all longer names come after them.  Every name
+     with a prefix shorter than 253 bytes thus sorts at or after the prefix
+     itself, and we can skip ahead to it if it comes after start.
+
+     This does not hold for longer prefixes:  A 256-byte name has the
+     length bytes fd 00 01, which sort before those of 253 to 255 bytes
+     (fd fd 00 to fd ff 00).  In that case, we just start from start.
+
+     Names with the prefix are not contiguous in either case (longer names
+     come later), so we still check each name and cannot stop at a
+     mismatch.  */
+  valtype seekTo = start;
+  if (prefix.size () < 253
+        && (prefix.size () > start.size ()
+              || (prefix.size () == start.size () && prefix > start)))
+    seekTo = prefix;
+
   std::unique_ptr<CNameIterator> iter(coinsTip.IterateNames ());
-  for (iter->seek (start); count > 0 && iter->next (name, data); )
+  for (iter->seek (seekTo); count > 0 && iter->next (name, data); )
     {
       const int height = data.getHeight ();
       if (height > maxHeight)
@@ -718,19 +778,15 @@ name_scan ()
       if (!std::equal (prefix.begin (), prefix.end (), name.begin ()))
         continue;
 
-      if (haveRegexp)
+      /* Names are required by consensus to be valid UTF-8 (see
+         IsNameValid), so we can match the regexp against the raw bytes
+         without validating the encoding again for each entry.  */
+      if (regexp != nullptr)
         {
-          try
-            {
-              const std::string nameStr = EncodeName (name, NameEncoding::UTF8);
-              boost::xpressive::smatch matches;
-              if (!boost::xpressive::regex_search (nameStr, matches, regexp))
-                continue;
-            }
-          catch (const InvalidNameString& exc)
-            {
-              continue;
-            }
+          const std::string nameStr(name.begin (), name.end ());
+          boost::xpressive::smatch matches;
+          if (!boost::xpressive::regex_search (nameStr, matches, *regexp))
+            continue;
         }
 
       res.push_back (getNameInfo (chainman, options, name, data, wallet));
@@ -20,6 +20,14 @@ def valueOfLength (size):
   return result
 
 
+# Names and values right at and just beyond the length limits.  They are
+# used in several places, so build them only once.
+maxLengthName = "x/" + "x" * 254
+tooLongName = "x/" + "x" * 255
+maxLengthValue = valueOfLength (2048)
+tooLongValue = valueOfLength (2049)
+
+
 class NameRegistrationTest (NameTestFramework):
 
   def set_test_params (self):
@@ -33,11 +41,15 @@ class NameRegistrationTest (NameTestFramework):
     up our balance tests).
     """
 
-    addr = self.nodes[1].getnewaddress ()
-    self.nodes[0].generatetoaddress (n, addr)
+    self.nodes[0].generatetoaddress (n, self.addrOther)
 
   def run_test (self):
     node = self.nodes[0]
+
+    # Addresses of the second node are only ever used as destinations,
+    # so we can request one up-front and reuse it everywhere.
+    self.addrOther = self.nodes[1].getnewaddress ()
+
     node.generate (50)
     self.generateToOther (150)
 
@@ -46,17 +58,17 @@ class NameRegistrationTest (NameTestFramework):
     addrA = node.getnewaddress ()
     txidA = node.name_register ("x/name-0", val ("value-0"),
                                 {"destAddress": addrA})
-    node.name_register ("x/name-1", valueOfLength (2048))
+    node.name_register ("x/name-1", maxLengthValue)
     assert_raises_rpc_error (-8, 'tx-value-too-long',
                              node.name_register,
-                             "x/dummy name", valueOfLength (2049))
-    node.name_register ("x/" + "x" * 254, val ("value"))
+                             "x/dummy name", tooLongValue)
+    node.name_register (maxLengthName, val ("value"))
     assert_raises_rpc_error (-8, 'tx-name-too-long',
                              node.name_register,
-                             "x/" + "x" * 255, val ("dummy value"))
+                             tooLongName, val ("dummy value"))
 
     # Check for exception with name_history and without -namehistory.
-    self.sync_blocks ()
+    self.syncBlocksFrom (0)
     assert_raises_rpc_error (-1, 'namehistory is not enabled',
                              self.nodes[1].name_history, "x/name-0")
 
@@ -66,10 +78,11 @@ class NameRegistrationTest (NameTestFramework):
                              "x/name-0", val ("foo"))
     
     # Check that the name data appears when the tx are mined.
-    assert_raises_rpc_error (-4, 'name not found',
-                             node.name_show, "x/name-0")
-    assert_raises_rpc_error (-4, 'name not found',
-                             node.name_history, "x/name-0")
+    for res in node.batch ([
+      node.name_show.get_request ("x/name-0"),
+      node.name_history.get_request ("x/name-0"),
+    ]):
+      assert_batch_rpc_error (res, -4, 'name not found')
     self.generateToOther (1)
     data = self.checkName (1, "x/name-0", val ("value-0"))
     assert_equal (data['address'], addrA)
@@ -77,25 +90,26 @@ class NameRegistrationTest (NameTestFramework):
     assert_equal (data['height'], 201)
 
     self.checkNameHistory (0, "x/name-0", [val ("value-0")])
-    self.checkNameHistory (0, "x/name-1", [valueOfLength (2048)])
+    self.checkNameHistory (0, "x/name-1", [maxLengthValue])
 
     # Check for disallowed registration when the name is active.
     self.checkName (0, "x/name-0", val ("value-0"))
     assert_raises_rpc_error (-25, 'exists already',
                              node.name_register, "x/name-0", val ("stolen"))
 
-    # Check basic updating.
+    # Check basic updating.  The expected history of "x/test-name" is
+    # accumulated as we go and verified once all updates are done.
     node.name_register ("x/test-name", val ("test-value"))
     self.generateToOther (1)
+    history = [val ("test-value")]
     assert_raises_rpc_error (-8, 'tx-value-too-long',
                              node.name_update,
-                             "x/test-name", valueOfLength (2049))
-    node.name_update ("x/test-name", valueOfLength (2048))
+                             "x/test-name", tooLongValue)
+    node.name_update ("x/test-name", maxLengthValue)
     self.checkName (0, "x/test-name", val ("test-value"))
     self.generateToOther (1)
-    self.checkName (0, "x/test-name", valueOfLength (2048))
-    self.checkNameHistory (0, "x/test-name",
-                           [val ("test-value"), valueOfLength (2048)])
+    self.checkName (0, "x/test-name", maxLengthValue)
+    history.append (maxLengthValue)
 
     # In Xaya, we also verify that the value must be valid JSON.
     # It is specifically allowed to have JSON objects with duplicated keys.
@@ -104,43 +118,36 @@ class NameRegistrationTest (NameTestFramework):
     node.name_update ("x/test-name", duplicateKeys)
     self.generateToOther (1)
     self.checkName (0, "x/test-name", duplicateKeys)
-    self.checkNameHistory (0, "x/test-name", [
-      val ("test-value"),
-      valueOfLength (2048),
-      duplicateKeys,
-    ])
+    history.append (duplicateKeys)
 
-    addrOther = self.nodes[1].getnewaddress ()
-    node.name_update ("x/test-name", val ("sent"), {"destAddress": addrOther})
+    node.name_update ("x/test-name", val ("sent"),
+                      {"destAddress": self.addrOther})
     self.generateToOther (1)
-    self.sync_blocks ()
+    self.syncBlocksFrom (0)
     data = self.checkName (0, "x/test-name", val ("sent"))
-    assert_equal (data['address'], addrOther)
+    assert_equal (data['address'], self.addrOther)
+    history.append (val ("sent"))
     self.nodes[1].name_update ("x/test-name", val ("updated"))
     self.nodes[1].generate (1)
-    self.sync_blocks ()
+    self.syncBlocksFrom (1)
     data = self.checkName (1, "x/test-name", val ("updated"))
-    self.checkNameHistory (0, "x/test-name", [
-      val ("test-value"),
-      valueOfLength (2048),
-      duplicateKeys,
-      val ("sent"),
-      val ("updated"),
-    ])
+    history.append (val ("updated"))
+    self.checkNameHistory (0, "x/test-name", history)
 
     # Invalid updates.
-    assert_raises_rpc_error (-25, 'this name can not be updated',
-                             node.name_update, "x/wrong-name", val ("foo"))
-    assert_raises_rpc_error (-6, 'Input tx not found in wallet',
-                             node.name_update, "x/test-name", val ("stolen?"))
+    res = node.batch ([
+      node.name_update.get_request ("x/wrong-name", val ("foo")),
+      node.name_update.get_request ("x/test-name", val ("stolen?")),
+    ])
+    assert_batch_rpc_error (res[0], -25, 'this name can not be updated')
+    assert_batch_rpc_error (res[1], -6, 'Input tx not found in wallet')
 
     # Test that name updates are even possible with less balance in the wallet
     # than what is locked in a name (0.01 NMC).  There was a bug preventing
     # this from working.
     balance = node.getbalance ()
     keep = Decimal ("0.001")
-    addrOther = self.nodes[1].getnewaddress ()
-    node.sendtoaddress (addrOther, balance - keep, "", "", True)
+    node.sendtoaddress (self.addrOther, balance - keep, "", "", True)
     self.generateToOther (1)
     assert_equal (node.getbalance (), keep)
     node.name_update ("x/name-1", val ("new value"))
@@ -12,12 +12,12 @@ from test_framework.util import *
 class NameReorgTest (NameTestFramework):
 
   def set_test_params (self):
-    self.setup_clean_chain = True
+    # We start from the framework's cached chain, which already has
+    # matured coins and is out of IBD.
     self.setup_name_test ([["-namehistory"]])
 
   def run_test (self):
     node = self.nodes[0]
-    node.generate (200)
 
     # Register a name prior to forking the chain.  This is used
     # to test unrolling of updates (as opposed to registrations).
@@ -28,45 +28,76 @@ class NameReorgTest (NameTestFramework):
     # the same registration on the short chain).
     node.name_register ("x/b", val ("b long"))
     undoBlk = node.generate (20)[0]
-    self.checkName (0, "x/a", val ("initial value"))
-    self.checkName (0, "x/b", val ("b long"))
-    self.checkNameHistory (0, "x/a", val (["initial value"]))
-    self.checkNameHistory (0, "x/b", val (["b long"]))
+    self.checkNames (0, {
+      "x/a": val ("initial value"),
+      "x/b": val ("b long"),
+    })
+    self.checkNameHistories (0, {
+      "x/a": val (["initial value"]),
+      "x/b": val (["b long"]),
+    })
     node.invalidateblock (undoBlk)
 
     # Build a short chain with an update to "a" and registrations.
     assert_equal (node.getrawmempool (), [])
     node.generate (1)
-    txidA = node.name_update ("x/a", val ("changed value"))
-    txidB = node.name_register ("x/b", val ("b short"))
-    txidC = node.name_register ("x/c", val ("c registered"))
+    txidA, txidB, txidC = self.batchCalls (0, [
+      ("name_update", ["x/a", val ("changed value")]),
+      ("name_register", ["x/b", val ("b short")]),
+      ("name_register", ["x/c", val ("c registered")]),
+    ])
     node.generate (1)
-    self.checkName (0, "x/a", val ("changed value"))
-    self.checkName (0, "x/b", val ("b short"))
-    self.checkName (0, "x/c", val ("c registered"))
-    self.checkNameHistory (0, "x/a", val (["initial value", "changed value"]))
-    self.checkNameHistory (0, "x/b", val (["b short"]))
-    self.checkNameHistory (0, "x/c", val (["c registered"]))
+    self.checkNames (0, {
+      "x/a": val ("changed value"),
+      "x/b": val ("b short"),
+      "x/c": val ("c registered"),
+    })
+    self.checkNameHistories (0, {
+      "x/a": val (["initial value", "changed value"]),
+      "x/b": val (["b short"]),
+      "x/c": val (["c registered"]),
+    })
 
     # Reconsider the long chain to reorg back to it.
     node.reconsiderblock (undoBlk)
-    self.checkName (0, "x/a", val ("initial value"))
-    self.checkName (0, "x/b", val ("b long"))
-    self.checkNameHistory (0, "x/a", val (["initial value"]))
-    self.checkNameHistory (0, "x/b", val (["b long"]))
-    assert_raises_rpc_error (-4, 'name not found', node.name_show, "x/c")
-    assert_raises_rpc_error (-4, 'name not found', node.name_history, "x/c")
+    self.checkNames (0, {
+      "x/a": val ("initial value"),
+      "x/b": val ("b long"),
+    })
+    self.checkNameHistories (0, {
+      "x/a": val (["initial value"]),
+      "x/b": val (["b long"]),
+    })
+    for res in node.batch ([
+      node.name_show.get_request ("x/c"),
+      node.name_history.get_request ("x/c"),
+    ]):
+      assert_batch_rpc_error (res, -4, 'name not found')
 
     # Mine another block.  This should at least perform the
-    # non-conflicting transactions.
-    assert_equal (set (node.getrawmempool ()), set ([txidA, txidC]))
+    # non-conflicting transactions.  Before that, verify that exactly those
+    # are in the mempool by looking them up directly.
+    res = node.batch ([
+      node.getmempoolinfo.get_request (),
+      node.getmempoolentry.get_request (txidA),
+      node.getmempoolentry.get_request (txidC),
+      node.getmempoolentry.get_request (txidB),
+    ])
+    assert_equal (res[0]['result']['size'], 2)
+    assert_equal (res[1].get ('error'), None)
+    assert_equal (res[2].get ('error'), None)
+    assert_batch_rpc_error (res[3], -5, 'Transaction not in mempool')
     node.generate (1)
-    self.checkName (0, "x/a", val ("changed value"))
-    self.checkName (0, "x/b", val ("b long"))
-    self.checkName (0, "x/c", val ("c registered"))
-    self.checkNameHistory (0, "x/a", val (["initial value", "changed value"]))
-    self.checkNameHistory (0, "x/b", val (["b long"]))
-    self.checkNameHistory (0, "x/c", val (["c registered"]))
+    self.checkNames (0, {
+      "x/a": val ("changed value"),
+      "x/b": val ("b long"),
+      "x/c": val ("c registered"),
+    })
+    self.checkNameHistories (0, {
+      "x/a": val (["initial value", "changed value"]),
+      "x/b": val (["b long"]),
+      "x/c": val (["c registered"]),
+    })
 
     # Check that the conflicting tx got handled properly.
     assert_equal (node.getrawmempool (), [])
@@ -26,12 +26,18 @@ class NameScanningTest (NameTestFramework):
     # Register some names with various data and heights.
     # Using both "aa" and "b" ensures that we can also check for the expected
     # comparison order between string length and lexicographic ordering.
-    self.node.name_register ("d/a", val ("wrong value"))
-    self.node.name_register ("d/aa", val ("value aa"))
-    self.node.name_register ("d/b", val ("value b"))
+    # Batch requests are executed in order, so the name operations can
+    # be sent together.
+    self.batchCalls (0, [
+      ("name_register", ["d/a", val ("wrong value")]),
+      ("name_register", ["d/aa", val ("value aa")]),
+      ("name_register", ["d/b", val ("value b")]),
+    ])
     self.node.generate (15)
-    self.node.name_register ("d/c", val ("value c"))
-    self.node.name_update ("d/a", val ("value a"))
+    self.batchCalls (0, [
+      ("name_register", ["d/c", val ("value c")]),
+      ("name_update", ["d/a", val ("value a")]),
+    ])
     self.node.generate (20)
 
     # Check the expected name_scan data values.
@@ -42,31 +48,31 @@ class NameScanningTest (NameTestFramework):
     self.checkNameData (scan[2], "d/c", val ("value c"))
     self.checkNameData (scan[3], "d/aa", val ("value aa"))
 
-    # Check for expected names in various basic name_scan calls.
-    self.checkList (self.node.name_scan (), ["d/a", "d/b", "d/c", "d/aa"])
-    self.checkList (self.node.name_scan ("", 0), [])
-    self.checkList (self.node.name_scan ("", -1), [])
-    self.checkList (self.node.name_scan ("d/b"), ["d/b", "d/c", "d/aa"])
-    self.checkList (self.node.name_scan ("d/zz"), [])
-    self.checkList (self.node.name_scan ("", 2), ["d/a", "d/b"])
-    self.checkList (self.node.name_scan ("d/b", 1), ["d/b"])
-
-    # Verify encoding for start argument.
-    self.checkList (self.node.name_scan ("642f63", 10, {"nameEncoding": "hex"}),
-                    ["642f63", "642f6161"])
-
-    # Verify filtering based on number of confirmations.
-    self.checkList (self.node.name_scan ("", 100, {"minConf": 35}),
-                    ["d/b", "d/aa"])
-    self.checkList (self.node.name_scan ("", 100, {"minConf": 36}), [])
-    self.checkList (self.node.name_scan ("", 100, {"maxConf": 19}), [])
-    self.checkList (self.node.name_scan ("", 100, {"maxConf": 20}),
-                    ["d/a", "d/c"])
-
-    # Verify interaction with filtering and count.
-    self.checkList (self.node.name_scan ("", 1, {"maxConf": 20}), ["d/a"])
-    self.checkList (self.node.name_scan ("", 2, {"maxConf": 20}),
-                    ["d/a", "d/c"])
+    # Check for expected names in various name_scan calls.  All of them
+    # are read-only, so they are sent as one batch request.  The call
+    # without arguments is already covered by the check above.
+    self.checkScans ([
+      # Basic calls.
+      (["", 0], []),
+      (["", -1], []),
+      (["d/b"], ["d/b", "d/c", "d/aa"]),
+      (["d/zz"], []),
+      (["", 2], ["d/a", "d/b"]),
+      (["d/b", 1], ["d/b"]),
+
+      # Verify encoding for start argument.
+      (["642f63", 10, {"nameEncoding": "hex"}], ["642f63", "642f6161"]),
+
+      # Verify filtering based on number of confirmations.
+      (["", 100, {"minConf": 35}], ["d/b", "d/aa"]),
+      (["", 100, {"minConf": 36}], []),
+      (["", 100, {"maxConf": 19}], []),
+      (["", 100, {"maxConf": 20}], ["d/a", "d/c"]),
+
+      # Verify interaction with filtering and count.
+      (["", 1, {"maxConf": 20}], ["d/a"]),
+      (["", 2, {"maxConf": 20}], ["d/a", "d/c"]),
+    ])
 
     # Error checks for confirmation options.
     assert_raises_rpc_error (-8, "minConf must be >= 1",
@@ -78,47 +84,67 @@ class NameScanningTest (NameTestFramework):
                              self.node.name_scan, "", 100, {"maxConf": -1})
     self.node.name_scan ("", 100, {"maxConf": 0})
 
-    # Verify filtering based on prefix.
-    self.checkList (self.node.name_scan ("", 100, {"prefix": ""}),
-                    ["d/a", "d/b", "d/c", "d/aa"])
-    self.checkList (self.node.name_scan ("", 100, {"prefix": "d/a"}),
-                    ["d/a", "d/aa"])
-
-    # Check prefix and nameEncoding.
-    options = {
-        "prefix": "642f61",
-        "nameEncoding": "hex",
-    }
-    self.checkList (self.node.name_scan ("", 100, options),
-                    ["642f61", "642f6161"])
+    # The prefix has to be valid in the name encoding.
     assert_raises_rpc_error (-1000, "Name/value is invalid for encoding ascii",
                              self.node.name_scan, "", 100, {"prefix": "äöü"})
 
-    # Verify filtering based on regexp.
-    self.checkList (self.node.name_scan ("", 100, {"regexp": "[ac]"}),
-                    ["d/a", "d/c", "d/aa"])
-
-    # Multiple filters are combined using "and".
-    options = {
-        "prefix": "d/a",
-        "maxConf": 20,
-    }
-    self.checkList (self.node.name_scan ("", 100, options), ["d/a"])
+    self.checkScans ([
+      # Verify filtering based on prefix.
+      (["", 100, {"prefix": ""}], ["d/a", "d/b", "d/c", "d/aa"]),
+      (["", 100, {"prefix": "d/a"}], ["d/a", "d/aa"]),
+      (["", 100, {"prefix": "d/aa"}], ["d/aa"]),
+      (["d/b", 100, {"prefix": "d/a"}], ["d/aa"]),
+      (["d/aa", 100, {"prefix": "d/b"}], []),
+
+      # Check prefix and nameEncoding.
+      (["", 100, {"prefix": "642f61", "nameEncoding": "hex"}],
+       ["642f61", "642f6161"]),
+
+      # Verify filtering based on regexp.
+      (["", 100, {"regexp": "[ac]"}], ["d/a", "d/c", "d/aa"]),
+      (["", 100, {"regexp": ""}], ["d/a", "d/b", "d/c", "d/aa"]),
+      (["", 100, {"regexp": ".*"}], ["d/a", "d/b", "d/c", "d/aa"]),
+      (["", 100, {"regexp": "."}], ["d/a", "d/b", "d/c", "d/aa"]),
+
+      # Multiple filters are combined using "and".
+      (["", 100, {"prefix": "d/a", "maxConf": 20}], ["d/a"]),
+    ])
+
+    # Names of 253 bytes or more have a multi-byte length prefix in the
+    # database key, so that a 256-byte name sorts before names of 253 to 255
+    # bytes.  Make sure that a long prefix still finds a 256-byte name.
+    longName = "d/" + "x" * 254
+    longPrefix = longName[:253]
+    assert_equal (len (longName), 256)
+    self.node.name_register (longName, val ("value long"))
+    self.node.generate (1)
+    self.checkScans ([
+      (["", 100, {"prefix": longPrefix}], [longName]),
+      (["d/b", 100, {"prefix": longPrefix}], [longName]),
+    ])
 
     # Upstream Namecoin tests here that a name with invalid UTF-8 doesn't
     # break name_filter's regexp check.  In Xaya, this name is invalid,
     # so we can't do this.
 
+  def checkScans (self, scans):
+    """
+    Sends multiple name_scan calls to the node in one batch request
+    and checks each result with checkList.  'scans' is a list of pairs
+    of the name_scan arguments and the expected names.
+    """
+
+    results = self.batchCalls (0, [("name_scan", args) for args, _ in scans])
+    for (_, names), data in zip (scans, results):
+      self.checkList (data, names)
+
   def checkList (self, data, names):
     """
     Check that the result in 'data' contains the names
     given in the array 'names'.
     """
 
-    def walker (e):
-      return e['name']
-    dataNames = list (map (walker, data))
-
+    dataNames = [e['name'] for e in data]
     assert_equal (dataNames, names)
 
 
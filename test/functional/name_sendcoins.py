@@ -25,17 +25,13 @@ class NameSendCoinsTest (NameTestFramework):
     # There should be two additional outputs: name and change
     assert_equal (len (vout), len (expected) + 2)
 
-    actual = {}
-    for out in vout:
-      if 'nameOp' in out['scriptPubKey']:
-        continue
-      addr = out['scriptPubKey']['address']
-      if not addr in expected:
-        # This must be the change address.  Through the assertion above about
-        # the expected sizes, we make sure that the test fails if there is
-        # not exactly one key with this property.
-        continue
-      actual[addr] = out['value']
+    # Outputs to addresses not in expected must be the change.  Through the
+    # assertion above about the expected sizes, we make sure that the test
+    # fails if there is not exactly one key with this property.
+    actual = {out['scriptPubKey']['address']: out['value']
+              for out in vout
+              if 'nameOp' not in out['scriptPubKey']
+                  and out['scriptPubKey']['address'] in expected}
 
     assert_equal (actual, expected)
 
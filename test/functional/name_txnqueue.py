@@ -9,20 +9,22 @@ from test_framework.util import *
 class NameTransactionQueueTest(NameTestFramework):
     def set_test_params(self):
         self.setup_name_test ([[]] * 1)
-        self.setup_clean_chain = True
 
     def run_test(self):
         node = self.nodes[0] # alias
-        node.generate(200) # get out of IBD
+        # The framework's cached chain is already out of IBD and has mature
+        # coins in the wallet, so there is no need to mine our own.
 
         self.log.info("Register a name.")
         addr = node.getnewaddress()
         txid = node.name_register("d/name", val("first"), {"destAddress": addr})
-        newTx = node.getrawtransaction(txid)
-        nameInd = self.rawtxOutputIndex(0, newTx, addr)
 
         self.log.info("Mine that transaction.")
         node.generate(1)
+        nameData = node.name_show("d/name")
+        assert_equal(nameData['txid'], txid)
+        assert_equal(nameData['address'], addr)
+        nameInd = nameData['vout']
 
         self.log.info("Create a NAME_UPDATE with sequence=12...")
         nameAmount = Decimal('0.01')
@@ -8,6 +8,7 @@
 from test_framework.names import NameTestFramework, val
 from test_framework.util import *
 
+from collections import Counter
 from decimal import Decimal
 
 nameFee = Decimal ("0.01")
@@ -33,19 +34,31 @@ class NameWalletTest (NameTestFramework):
     addr = "cmUcickA9iRQpTTnwoXrrxCpb73ggpQiAn"
     self.nodes[ind].generatetoaddress (n, addr)
 
-  def getFee (self, ind, txid, extra=zero):
+  def getTransactions (self, ind, txids):
+    """
+    Queries gettransaction for all the given txids from the node with
+    index ind in a single batch request.  The results can be passed on
+    to getFee and checkTx, so that they need not query them again.
+    """
+
+    return self.batchCalls (ind, [("gettransaction", [t]) for t in txids])
+
+  def getFee (self, ind, txid, extra=zero, info=None):
     """
     Returns and checks the fee of a transaction.  There may be an additional
     fee for the locked coin, and the paytxfee times the tx size.
-    The tx size is queried from the node with the given index by the txid.
+    The tx size is queried from the node with the given index by the txid,
+    unless its gettransaction result is passed in already as info.
     """
 
-    info = self.nodes[ind].gettransaction (txid)
+    if info is None:
+      info = self.nodes[ind].gettransaction (txid)
     totalFee = -info['fee']
     assert totalFee >= extra
 
     absFee = totalFee - extra
-    size = count_bytes (info['hex'])
+    # The hex string has two characters per byte of the transaction.
+    size = len (info['hex']) // 2
     assert_fee_amount (absFee, size, txFee)
 
     return totalFee
@@ -58,7 +71,6 @@ class NameWalletTest (NameTestFramework):
 
     bal = self.nodes[ind].getbalance ()
     assert_equal (bal, initialBalance - spent)
-    assert_equal (self.nodes[ind].getbalance (), bal)
 
   def checkBalances (self, spentA=zero, spentB=zero):
     """
@@ -73,7 +85,7 @@ class NameWalletTest (NameTestFramework):
     self.checkBalance (0, self.spentA)
     self.checkBalance (1, self.spentB)
 
-  def checkTx (self, ind, txid, amount, fee, details):
+  def checkTx (self, ind, txid, amount, fee, details, info=None):
     """
     Calls 'gettransaction' and compares the result to the
     expected data given in the arguments.  "details" is an array
@@ -83,46 +95,41 @@ class NameWalletTest (NameTestFramework):
       [category, nameop, amount, fee]
 
     nameop can be None if no "name" key is expected.
+
+    If the gettransaction result has been queried already (e.g. with
+    getTransactions), it can be passed as info instead.
     """
 
-    data = self.nodes[ind].gettransaction (txid)
-    assert_equal (data['amount'], amount)
+    if info is None:
+      info = self.nodes[ind].gettransaction (txid)
+    assert_equal (info['amount'], amount)
 
     if fee is None:
-      assert 'fee' not in data
+      assert 'fee' not in info
     else:
-      assert_equal (data['fee'], fee)
+      assert_equal (info['fee'], fee)
 
     # Bring the details returned in the same format as our expected
     # argument.  Furthermore, check that each entry has an address
     # set (but don't compare the address, since we don't know it).
     detailsGot = []
-    for d in data['details']:
+    for d in info['details']:
       assert 'address' in d
-      if 'name' in d:
-        nameOp = d['name']
-        if nameOp[:3] == 'new':
-          nameOp = 'new'
-      else:
-        # None is not sortable in Python3, so use "none" instead.
-        nameOp = "none"
-      if 'fee' in d:
-        fee = d['fee']
-      else:
-        fee = None
-      detailsGot.append ([d['category'], nameOp, d['amount'], fee])
-
-    # Compare.  Sort to get rid of differences in the order.
-    detailsGot.sort ()
-    details.sort ()
-    assert_equal (detailsGot, details)
+      nameOp = d.get ('name')
+      if nameOp is not None and nameOp[:3] == 'new':
+        nameOp = 'new'
+      detailsGot.append ([d['category'], nameOp, d['amount'], d.get ('fee')])
+
+    # Compare as multisets to get rid of differences in the order.
+    assert_equal (Counter (map (tuple, detailsGot)),
+                  Counter (map (tuple, details)))
 
   def run_test (self):
     self.nodes[0].generate (50)
-    self.sync_blocks ()
+    self.syncBlocksFrom (0)
     self.nodes[1].generate (50)
     self.generateToOther (1, 150)
-    self.sync_blocks ()
+    self.syncBlocksFrom (1)
     self.checkBalances ()
 
     # Check that we use legacy addresses.
@@ -143,18 +150,20 @@ class NameWalletTest (NameTestFramework):
     self.checkBalances (updFee)
 
     # Check the transactions.
+    infoRegA, infoUpdA = self.getTransactions (0, [regA, updA])
     self.checkTx (0, regA, zero, -regFee,
-                  [['send', "update: 'x/name-a'", zero, -regFee]])
+                  [['send', "update: 'x/name-a'", zero, -regFee]], infoRegA)
     self.checkTx (0, updA, zero, -updFee,
-                  [['send', "update: 'x/name-a'", zero, -updFee]])
+                  [['send', "update: 'x/name-a'", zero, -updFee]], infoUpdA)
 
     # Send a name from 0 to 1 by registration and update.
     addr = self.nodes[1].getnewaddress ()
     regB = self.nodes[0].name_register ("x/name-b", val ("value"),
                                         {"destAddress": addr})
-    fee = self.getFee (0, regB, nameFee)
     regC = self.nodes[0].name_register ("x/name-c", val ("value"))
-    fee += self.getFee (0, regC, nameFee)
+    infoRegB, infoRegC = self.getTransactions (0, [regB, regC])
+    fee = self.getFee (0, regB, nameFee, infoRegB)
+    fee += self.getFee (0, regC, nameFee, infoRegC)
     self.generateToOther (0, 1)
     self.checkBalances (fee)
     updC = self.nodes[0].name_update ("x/name-c", val ("new value"),
@@ -164,11 +173,12 @@ class NameWalletTest (NameTestFramework):
     self.checkBalances (fee)
 
     # Check the receiving transactions on node 1.
-    self.sync_blocks ()
+    self.syncBlocksFrom (0)
+    recvRegB, recvUpdC = self.getTransactions (1, [regB, updC])
     self.checkTx (1, regB, zero, None,
-                  [['receive', "update: 'x/name-b'", zero, None]])
+                  [['receive', "update: 'x/name-b'", zero, None]], recvRegB)
     self.checkTx (1, updC, zero, None,
-                  [['receive', "update: 'x/name-c'", zero, None]])
+                  [['receive', "update: 'x/name-c'", zero, None]], recvUpdC)
 
     # Use the rawtx API to build a simultaneous name update and currency send.
     # This is done as an atomic name trade.  Note, though, that the
@@ -179,12 +189,12 @@ class NameWalletTest (NameTestFramework):
     txid = self.atomicTrade ("x/name-a", val ("enjoy"), price, fee, 0, 1)
     self.generateToOther (0, 1)
 
-    self.sync_blocks ()
+    self.syncBlocksFrom (0)
     self.checkBalances (-price, price + fee)
     self.checkTx (0, txid, price, None,
-                  [['receive', "none", price, None]])
+                  [['receive', None, price, None]])
     self.checkTx (1, txid, -price, -fee,
-                  [['send', "none", -price, -fee],
+                  [['send', None, -price, -fee],
                    ['send', "update: 'x/name-a'", zero, -fee]])
 
     # Test sendtoname RPC command.
@@ -195,20 +205,20 @@ class NameWalletTest (NameTestFramework):
     self.checkName (0, "x/destination", val ("value"))
     self.checkBalances (self.getFee (0, txid, nameFee))
 
-    self.sync_blocks ()
+    self.syncBlocksFrom (0)
     assert_raises_rpc_error (-5, 'name not found',
                              self.nodes[1].sendtoname, "x/non-existant", 10)
 
     txid = self.nodes[1].sendtoname ("x/destination", 10)
     fee = self.getFee (1, txid)
     self.generateToOther (1, 1)
-    self.sync_blocks ()
+    self.syncBlocksFrom (1)
     self.checkBalances (-10, 10 + fee)
 
     txid = self.nodes[1].sendtoname ("x/destination", 10, "foo", "bar", True)
     fee = self.getFee (1, txid)
     self.generateToOther (1, 1)
-    self.sync_blocks ()
+    self.syncBlocksFrom (1)
     self.checkBalances (-10 + fee, 10)
 
 
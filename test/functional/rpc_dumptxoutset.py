@@ -7,9 +7,12 @@
 
 from test_framework.blocktools import COINBASE_MATURITY
 from test_framework.test_framework import BitcoinTestFramework
-from test_framework.util import assert_equal, assert_raises_rpc_error
+from test_framework.util import (
+    assert_equal,
+    assert_raises_rpc_error,
+    sha256sum_file,
+)
 
-import hashlib
 from pathlib import Path
 
 
@@ -39,11 +42,10 @@ class DumptxoutsetTest(BitcoinTestFramework):
             out['base_hash'],
             'c73afbf5785c2ff93f94d3316c74a85b33a3af4dad7eb21b5945968422fb9216')
 
-        with open(str(expected_path), 'rb') as f:
-            digest = hashlib.sha256(f.read()).hexdigest()
-            # UTXO snapshot hash should be deterministic based on mocked time.
-            assert_equal(
-                digest, '3644458be397fb008242057c40a5c4583fddc1b793fbcc4c67e5b06504b5e9eb')
+        # UTXO snapshot hash should be deterministic based on mocked time.
+        assert_equal(
+            sha256sum_file(expected_path).hex(),
+            '3644458be397fb008242057c40a5c4583fddc1b793fbcc4c67e5b06504b5e9eb')
 
         # Specifying a path to an existing file will fail.
         assert_raises_rpc_error(
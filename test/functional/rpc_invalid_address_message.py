@@ -35,44 +35,38 @@ class InvalidAddressErrorMessageTest(BitcoinTestFramework):
     def test_validateaddress(self):
         node = self.nodes[0]
 
-        # Bech32
-        info = node.validateaddress(BECH32_INVALID_SIZE)
-        assert not info['isvalid']
-        assert_equal(info['error'], 'Invalid Bech32 address data size')
-
-        info = node.validateaddress(BECH32_INVALID_PREFIX)
-        assert not info['isvalid']
-        assert_equal(info['error'], 'Invalid prefix for Bech32 address')
-
-        info = node.validateaddress(BECH32_INVALID_BECH32)
-        assert not info['isvalid']
-        assert_equal(info['error'], 'Version 1+ witness address must use Bech32m checksum')
-
-        info = node.validateaddress(BECH32_INVALID_BECH32M)
-        assert not info['isvalid']
-        assert_equal(info['error'], 'Version 0 witness address must use Bech32 checksum')
-
-        info = node.validateaddress(BECH32_INVALID_V0_SIZE)
-        assert not info['isvalid']
-        assert_equal(info['error'], 'Invalid Bech32 v0 address data size')
-
-        info = node.validateaddress(BECH32_VALID)
-        assert info['isvalid']
-        assert 'error' not in info
-
-        # Base58
-        info = node.validateaddress(BASE58_INVALID_PREFIX)
-        assert not info['isvalid']
-        assert_equal(info['error'], 'Invalid prefix for Base58-encoded address')
-
-        info = node.validateaddress(BASE58_VALID)
-        assert info['isvalid']
-        assert 'error' not in info
-
-        # Invalid address format
-        info = node.validateaddress(INVALID_ADDRESS)
-        assert not info['isvalid']
-        assert_equal(info['error'], 'Invalid address format')
+        # Each case is an address together with the expected error, or None
+        # if the address is valid.  validateaddress reports invalid addresses
+        # in its result rather than failing, so all cases are sent to the
+        # node in a single batch request.
+        cases = [
+            # Bech32
+            (BECH32_INVALID_SIZE, 'Invalid Bech32 address data size'),
+            (BECH32_INVALID_PREFIX, 'Invalid prefix for Bech32 address'),
+            (BECH32_INVALID_BECH32, 'Version 1+ witness address must use Bech32m checksum'),
+            (BECH32_INVALID_BECH32M, 'Version 0 witness address must use Bech32 checksum'),
+            (BECH32_INVALID_V0_SIZE, 'Invalid Bech32 v0 address data size'),
+            (BECH32_VALID, None),
+
+            # Base58
+            (BASE58_INVALID_PREFIX, 'Invalid prefix for Base58-encoded address'),
+            (BASE58_VALID, None),
+
+            # Invalid address format
+            (INVALID_ADDRESS, 'Invalid address format'),
+        ]
+
+        results = node.batch([node.validateaddress.get_request(addr) for addr, _ in cases])
+        assert_equal(len(results), len(cases))
+        for (_, error), res in zip(cases, results):
+            assert_equal(res.get('error'), None)
+            info = res['result']
+            if error is None:
+                assert info['isvalid']
+                assert 'error' not in info
+            else:
+                assert not info['isvalid']
+                assert_equal(info['error'], error)
 
     def test_getaddressinfo(self):
         node = self.nodes[0]
@@ -6,6 +6,7 @@
 
 from test_framework.test_framework import BitcoinTestFramework
 from test_framework.util import (
+    assert_batch_rpc_error,
     assert_equal,
     assert_raises_rpc_error,
 )
@@ -44,15 +45,22 @@ class SignMessagesTest(BitcoinTestFramework):
         assert not self.nodes[0].verifymessage(address, other_signature, message)
 
         self.log.info('test parameter validity and error codes')
-        # signmessage(withprivkey) have two required parameters
+        # signmessage(withprivkey) have two required parameters, and
+        # verifymessage has three.  All wrong-arity calls are sent together
+        # in one batch request.
+        node = self.nodes[0]
+        calls = []
         for num_params in [0, 1, 3, 4, 5]:
             param_list = ["dummy"]*num_params
-            assert_raises_rpc_error(-1, "signmessagewithprivkey", self.nodes[0].signmessagewithprivkey, *param_list)
-            assert_raises_rpc_error(-1, "signmessage", self.nodes[0].signmessage, *param_list)
-        # verifymessage has three required parameters
+            calls.append(("signmessagewithprivkey", param_list))
+            calls.append(("signmessage", param_list))
         for num_params in [0, 1, 2, 4, 5]:
             param_list = ["dummy"]*num_params
-            assert_raises_rpc_error(-1, "verifymessage", self.nodes[0].verifymessage, *param_list)
+            calls.append(("verifymessage", param_list))
+        results = node.batch([getattr(node, method).get_request(*params) for method, params in calls])
+        assert_equal(len(results), len(calls))
+        for (method, _), res in zip(calls, results):
+            assert_batch_rpc_error(res, -1, method)
         # invalid key or address provided
         assert_raises_rpc_error(-5, "Invalid private key", self.nodes[0].signmessagewithprivkey, "invalid_key", message)
         assert_raises_rpc_error(-5, "Invalid address", self.nodes[0].signmessage, "invalid_addr", message)
@@ -72,6 +72,7 @@ class AuthServiceProxy():
     def __init__(self, service_url, service_name=None, timeout=HTTP_TIMEOUT, connection=None, ensure_ascii=True):
         self.__service_url = service_url
         self._service_name = service_name
+        self.__method_proxies = {}
         self.ensure_ascii = ensure_ascii  # can be toggled on the fly by tests
         self.__url = urllib.parse.urlparse(service_url)
         user = None if self.__url.username is None else self.__url.username.encode('utf8')
@@ -87,7 +88,13 @@ class AuthServiceProxy():
             raise AttributeError
         if self._service_name is not None:
             name = "%s.%s" % (self._service_name, name)
-        return AuthServiceProxy(self.__service_url, name, connection=self.__conn)
+        # The proxies for individual methods only differ in their name, so create
+        # each of them once (parsing the URL and credentials) and reuse it later.
+        proxy = self.__method_proxies.get(name)
+        if proxy is None:
+            proxy = AuthServiceProxy(self.__service_url, name, connection=self.__conn)
+            self.__method_proxies[name] = proxy
+        return proxy
 
     def _request(self, method, path, postdata):
         '''
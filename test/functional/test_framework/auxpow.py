@@ -7,8 +7,8 @@
 # auxpow_testing.py), but also for contrib/auxpow/getwork-wrapper.py.
 
 import binascii
-import codecs
 import hashlib
+import struct
 
 def constructAuxpow (block):
   """
@@ -16,7 +16,7 @@ def constructAuxpow (block):
   coinbase tx and the unmined parent block header as hex strings.
   """
 
-  block = codecs.encode (block, 'ascii')
+  block = block.encode ('ascii')
 
   # Start by building the merge-mining coinbase.  The merkle tree
   # consists only of the block hash as root.
@@ -27,7 +27,7 @@ def constructAuxpow (block):
   # Construct "vector" of transaction inputs.
   vin = b"01"
   vin += (b"00" * 32) + (b"ff" * 4)
-  vin += codecs.encode ("%02x" % (len (coinbase) // 2), "ascii") + coinbase
+  vin += b"%02x" % (len (coinbase) // 2) + coinbase
   vin += (b"ff" * 4)
 
   # Build up the full coinbase transaction.  It consists only
@@ -54,7 +54,7 @@ def finishAuxpow (tx, header):
   blockhash = doubleHashHex (header)
 
   # Build the MerkleTx part of the auxpow.
-  auxpow = codecs.encode (tx, 'ascii')
+  auxpow = tx.encode ('ascii')
   auxpow += blockhash
   auxpow += b"00"
   auxpow += b"00" * 4
@@ -66,39 +66,36 @@ def finishAuxpow (tx, header):
 
   return auxpow.decode ("ascii")
 
-def doubleHashHex (data):
+def doubleHash (data):
   """
-  Perform Bitcoin's Double-SHA256 hash on the given hex string.
+  Perform Bitcoin's Double-SHA256 hash on the given raw bytes.  The result
+  is returned as bytes in display order (i.e. reversed).
   """
 
-  hasher = hashlib.sha256 ()
-  hasher.update (binascii.unhexlify (data))
-  data = hasher.digest ()
+  inner = hashlib.sha256 (data).digest ()
+  return hashlib.sha256 (inner).digest ()[::-1]
 
-  hasher = hashlib.sha256 ()
-  hasher.update (data)
+def doubleHashHex (data):
+  """
+  Perform Bitcoin's Double-SHA256 hash on the given hex string.
+  """
 
-  return reverseHex (hasher.hexdigest ())
+  return binascii.hexlify (doubleHash (binascii.unhexlify (data)))
 
 def reverseHex (data):
   """
   Flip byte order in the given data (hex string).
   """
 
-  b = bytearray (binascii.unhexlify (data))
-  b.reverse ()
-
-  return binascii.hexlify (b)
+  return binascii.hexlify (binascii.unhexlify (data)[::-1])
 
 def getworkByteswap (data):
   """
   Run the byte-order swapping step necessary for working with getwork.
   """
 
-  data = bytearray (data)
   assert len (data) % 4 == 0
-  for i in range (0, len (data), 4):
-    data[i], data[i + 3] = data[i + 3], data[i]
-    data[i + 1], data[i + 2] = data[i + 2], data[i + 1]
+  fmt = "%dI" % (len (data) // 4)
+  words = struct.unpack ("<" + fmt, data)
 
-  return data
+  return bytearray (struct.pack (">" + fmt, *words))
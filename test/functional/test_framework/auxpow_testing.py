@@ -8,7 +8,6 @@
 # difficulty) or inspecting the information for verification.
 
 import binascii
-import codecs
 
 from test_framework import auxpow
 from test_framework import powhash
@@ -76,23 +75,36 @@ def getCoinbaseAddr (node, blockHash):
 
     return txData['vout'][0]['scriptPubKey']['address']
 
-def mineBlock (header, target, ok, hashFcn=auxpow.doubleHashHex):
+def mineBlock (header, target, ok, hashFcn=auxpow.doubleHash):
   """
   Given a block header, update the nonce until it is ok (or not)
-  for the given target.
+  for the given target.  The header and target are given as hex strings,
+  and the resulting header and hash are returned as hex as well.
   """
 
-  data = bytearray (binascii.unhexlify (header))
+  data, blockhash = mineBlockBytes (binascii.unhexlify (header),
+                                    binascii.unhexlify (target), ok, hashFcn)
+  return (binascii.hexlify (data), binascii.hexlify (blockhash))
+
+def mineBlockBytes (header, target, ok, hashFcn=auxpow.doubleHash):
+  """
+  Like mineBlock, but with the header, target and results as raw bytes.
+
+  hashFcn is called on the raw header bytes and must return the hash
+  as bytes in display order, so that it can be compared to the target
+  directly.
+  """
+
+  data = bytearray (header)
   while True:
     assert data[79] < 255
     data[79] += 1
-    hexData = binascii.hexlify (data)
 
-    blockhash = hashFcn (hexData)
+    blockhash = hashFcn (bytes (data))
     if (ok and blockhash < target) or ((not ok) and blockhash > target):
       break
 
-  return (hexData, blockhash)
+  return (bytes (data), blockhash)
 
 def solveData (hexData, target, ok):
   """
@@ -101,18 +113,13 @@ def solveData (hexData, target, ok):
   stand-alone (getwork) blocks.
   """
 
-  data = codecs.decode (hexData, 'hex_codec')
-  data = auxpow.getworkByteswap (data[:80])
+  data = auxpow.getworkByteswap (binascii.unhexlify (hexData)[:80])
 
-  def neoscrypt (hexStr):
-    rawData = codecs.decode (hexStr, 'hex_codec')
-    rawHash = bytearray (powhash.forHeader ('neoscrypt', rawData))
-    rawHash.reverse ()
-    return codecs.encode (rawHash, 'hex_codec')
+  def neoscrypt (rawData):
+    return powhash.forHeader ('neoscrypt', rawData)[::-1]
 
-  hexSolved, h = mineBlock (codecs.encode (data, 'hex_codec'), target, ok,
-                            hashFcn=neoscrypt)
-  solved = codecs.decode (hexSolved, 'hex_codec')
+  solved, _ = mineBlockBytes (data, binascii.unhexlify (target), ok,
+                              hashFcn=neoscrypt)
 
   solved = auxpow.getworkByteswap (solved)
-  return codecs.decode (codecs.encode (solved, 'hex_codec'), 'ascii')
+  return binascii.hexlify (solved).decode ('ascii')
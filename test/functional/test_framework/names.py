@@ -36,6 +36,27 @@ class NameTestFramework (BitcoinTestFramework):
     # test_framework.py.  This is needed to get us out of IBD.
     self.mocktime = 1388534400 + (201 * 10 * 60)
 
+  def syncBlocksFrom (self, ind):
+    """
+    Waits until all other nodes have the best block of the node with the
+    given index.  Unlike sync_blocks, this does not poll all nodes in
+    a loop but lets each node wait (server-side) with waitforblock.
+    """
+
+    tip = self.nodes[ind].getbestblockhash ()
+
+    for i, n in enumerate (self.nodes):
+      if i == ind:
+        continue
+
+      # The HTTP timeout of the RPC connection is half of rpc_timeout.
+      # Wait only half of that server-side, so that a stuck sync fails
+      # the assertion below rather than timing out the socket.
+      timeoutMs = int (n.rpc_timeout * 1000 // 4)
+
+      res = n.waitforblock (tip, timeoutMs)
+      assert_equal (res['hash'], tip)
+
   def checkName (self, ind, name, value):
     """
     Query a name with name_show and check that certain data fields
@@ -62,6 +83,12 @@ class NameTestFramework (BitcoinTestFramework):
     """
 
     data = self.nodes[ind].name_history (name)
+    self.checkNameHistoryData (data, name, values)
+
+  def checkNameHistoryData (self, data, name, values):
+    """
+    Check a name_history result against the expected values.
+    """
 
     valuesFound = []
     for e in data:
@@ -70,6 +97,59 @@ class NameTestFramework (BitcoinTestFramework):
 
     assert_equal (valuesFound, values)
 
+  def batchCalls (self, ind, calls):
+    """
+    Sends multiple RPC calls to the node with index ind as a single
+    JSON-RPC batch request.  'calls' is a list of (method, args) tuples.
+    The server processes them in order.  Returns the list of results
+    in the same order, asserting that none of the calls failed.
+    """
+
+    node = self.nodes[ind]
+    res = node.batch ([
+      getattr (node, method).get_request (*args)
+      for method, args in calls
+    ])
+    assert_equal (len (res), len (calls))
+
+    # With --usecli, successful responses have no 'error' key at all.
+    results = []
+    for r in res:
+      assert_equal (r.get ('error'), None)
+      results.append (r['result'])
+
+    return results
+
+  def batchForNames (self, ind, method, names):
+    """
+    Calls the given RPC method (e.g. name_show) for each of the names
+    in a single batch request (see batchCalls).
+    """
+
+    return self.batchCalls (ind, [(method, [n]) for n in names])
+
+  def checkNames (self, ind, expected):
+    """
+    Checks the values of multiple names with one batched round-trip
+    of name_show calls.  'expected' is a dictionary mapping each name
+    to its expected value.
+    """
+
+    names = list (expected.keys ())
+    for name, data in zip (names, self.batchForNames (ind, "name_show", names)):
+      self.checkNameData (data, name, expected[name])
+
+  def checkNameHistories (self, ind, expected):
+    """
+    Like checkNames, but checks the name_history of all names (given as
+    a dictionary of name to the list of expected values) in one batch.
+    """
+
+    names = list (expected.keys ())
+    results = self.batchForNames (ind, "name_history", names)
+    for name, data in zip (names, results):
+      self.checkNameHistoryData (data, name, expected[name])
+
   def rawtxOutputIndex (self, ind, txhex, addr):
     """
     Returns the index of the tx output in the given raw transaction that
@@ -93,13 +173,18 @@ class NameTestFramework (BitcoinTestFramework):
     other way round.  Returned is the txid.
     """
 
-    addrA = self.nodes[nameFrom].getnewaddress ()
-    addrB = self.nodes[nameTo].getnewaddress ()
-    addrChange = self.nodes[nameTo].getrawchangeaddress ()
+    # Query all independent data up-front, with one batch per node.
+    addrA, data = self.batchCalls (nameFrom, [
+      ("getnewaddress", []),
+      ("name_show", [name]),
+    ])
+    addrB, addrChange, unspents = self.batchCalls (nameTo, [
+      ("getnewaddress", []),
+      ("getrawchangeaddress", []),
+      ("listunspent", []),
+    ])
 
     inputs = []
-
-    unspents = self.nodes[nameTo].listunspent ()
     txin = None
     for u in unspents:
       if u['amount'] >= price + fee:
@@ -109,15 +194,17 @@ class NameTestFramework (BitcoinTestFramework):
     change = txin['amount'] - price - fee
     inputs.append ({"txid": txin['txid'], "vout": txin['vout']})
 
-    data = self.nodes[nameFrom].name_show (name)
     nameTxo = self.nodes[nameFrom].gettxout (data['txid'], data['vout'])
     nameAmount = nameTxo['value']
 
     inputs.append ({"txid": data['txid'], "vout": data['vout']})
-    outputs = {addrA: price, addrChange: change, addrB: nameAmount}
+    # Pass the outputs as a list, so that their order in the transaction
+    # is fixed and we know the index of the name output without having
+    # to decode the transaction again.
+    outputs = [{addrA: price}, {addrChange: change}, {addrB: nameAmount}]
+    nameInd = len (outputs) - 1
     tx = self.nodes[nameFrom].createrawtransaction (inputs, outputs)
 
-    nameInd = self.rawtxOutputIndex (nameFrom, tx, addrB)
     nameOp = {"op": "name_update", "name": name, "value": value}
     tx = self.nodes[nameFrom].namerawtransaction (tx, nameInd, nameOp)
 
@@ -149,6 +149,33 @@ def try_rpc(code, message, fun, *args, **kwds):
         return False
 
 
+def assert_batch_rpc_error(response, code: Optional[int], message: Optional[str]):
+    """Verify that a single response from a JSON-RPC batch request is the expected error.
+
+    This is the equivalent of assert_raises_rpc_error for calls that are sent
+    together in one request through `batch`, where errors are returned as part
+    of the individual responses instead of being raised.
+
+    Args:
+        response: one element of the list returned by `batch`.  Both the
+            JSON-RPC response of AuthServiceProxy and the emulated response
+            of TestNodeCLI (which has the JSONRPCException as error) work.
+        code: the expected error code, or None if it should not be checked.
+        message: [a substring of] the expected error string, or None if it
+            should not be checked.
+    """
+    error = response.get('error')
+    assert error is not None, "No error returned"
+    if isinstance(error, JSONRPCException):
+        error = error.error
+    if (code is not None) and (code != error["code"]):
+        raise AssertionError("Unexpected JSONRPC error code %i" % error["code"])
+    if (message is not None) and (message not in error['message']):
+        raise AssertionError(
+            "Expected substring not found in error message:\nsubstring: '{}'\nerror message: '{}'.".format(
+                message, error['message']))
+
+
 def assert_is_hex_string(string):
     try:
         int(string, 16)
@@ -264,13 +291,19 @@ def wait_until_helper(predicate, *, attempts=float('inf'), timeout=float('inf'),
         raise AssertionError("Predicate {} not true after {} seconds".format(predicate_source, timeout))
     raise RuntimeError('Unreachable')
 
+SHA256SUM_CHUNK_SIZE = 1 << 20
+
+
 def sha256sum_file(filename):
-    h = hashlib.sha256()
     with open(filename, 'rb') as f:
-        d = f.read(4096)
+        # hashlib.file_digest is only available from Python 3.11.
+        if hasattr(hashlib, 'file_digest'):
+            return hashlib.file_digest(f, 'sha256').digest()
+        h = hashlib.sha256()
+        d = f.read(SHA256SUM_CHUNK_SIZE)
         while len(d) > 0:
             h.update(d)
-            d = f.read(4096)
+            d = f.read(SHA256SUM_CHUNK_SIZE)
     return h.digest()
 
 # RPC/P2P connection constants and functions